@@ -1,10 +1,13 @@
 import re
 import os
+import asyncio
+import time
+from functools import lru_cache
 from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import discord
 from discord.ext import commands
-import dateparser
 
 # ==============================
 # CONFIG
@@ -21,15 +24,19 @@ intents.message_content = True
 
 bot = commands.Bot(command_prefix="!", intents=intents)
 
+# Resolved once at startup so the Yes button doesn't look it up every time
+_study_channel: discord.TextChannel | None = None
+
 # ==============================
 # SMARTER MESSAGE DETECTION
 # ==============================
 
-INTENT_KEYWORDS = [
+# Shortest form of each keyword. Intent words are anchored only at the start
+# of a word, so "study" already covers "studying", "study group", etc.
+# Schedule words match anywhere, so "night" still catches "midnight" and
+# "weekend" covers "this weekend".
+INTENT_KEYWORDS = frozenset({
     "study",
-    "studying",
-    "study together",
-    "study group",
     "review",
     "go over",
     "look over",
@@ -38,23 +45,19 @@ INTENT_KEYWORDS = [
     "go through",
     "session",
     "meet",
-    "meet up",
     "link up",
     "group up",
-]
+})
 
-SCHEDULE_KEYWORDS = [
+SCHEDULE_KEYWORDS = frozenset({
     "today",
     "tomorrow",
     "tonight",
     "later",
-    "this weekend",
     "weekend",
     "after class",
     "after lecture",
     "after lab",
-    "this afternoon",
-    "this evening",
     "morning",
     "afternoon",
     "evening",
@@ -66,10 +69,61 @@ SCHEDULE_KEYWORDS = [
     "friday",
     "saturday",
     "sunday",
-]
+})
+
+# Each keyword set as one compiled pattern (sorted so the pattern is stable)
+INTENT_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(k) for k in sorted(INTENT_KEYWORDS)) + ")",
+    re.IGNORECASE,
+)
+SCHEDULE_RE = re.compile(
+    r"(?:" + "|".join(re.escape(k) for k in sorted(SCHEDULE_KEYWORDS)) + ")",
+    re.IGNORECASE,
+)
+
+# Short pieces that every intent keyword contains. If none of these show up,
+# the message can't have an intent keyword, so we can bail out early.
+INTENT_PREFIX_TRIGGERS = (
+    "stud",
+    "meet",
+    "revi",
+    "pract",
+    "sess",
+    "group",
+    "link",
+    "go ",
+    "run ",
+    "look",
+    "through",
+)
 
 # Matches times like: 4pm, 4 pm, 4:00, 16:00, 7:30pm, etc
-TIME_PATTERN = r"\b(\d{1,2}(:\d{2})?\s?(am|pm)|\d{1,2}:\d{2})\b"
+TIME_RE = re.compile(r"\b(\d{1,2}(:\d{2})?\s?(am|pm)|\d{1,2}:\d{2})\b", re.IGNORECASE)
+
+# A time always has a digit in it
+_DIGIT_RE = re.compile(r"[0-9]")
+
+# Day words the fast path in parse_when understands, and how to turn the
+# matched time into a datetime without going through dateparser
+DAY_RE = re.compile(
+    r"\b(next\s+)?(today|tonight|tomorrow"
+    r"|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b",
+    re.IGNORECASE,
+)
+WEEKDAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+TIME_FORMATS = ["%I:%M%p", "%I%p", "%H:%M"]
+LOCAL_TZ = ZoneInfo("America/New_York")
+
+# dateparser is slow to import and heavy on memory, so it is only loaded
+# the first time parse_when actually needs it
+_dp = None
+
+
+def _dateparser():
+    global _dp
+    if _dp is None:
+        import dateparser as _dp
+    return _dp
 
 
 def parse_when(text: str):
@@ -84,30 +138,98 @@ def parse_when(text: str):
     Returns:
       datetime or None
     """
-    # First, let dateparser try on the full text
-    parsed = dateparser.parse(
+    # Relative phrases like "tomorrow" depend on the current time, so the
+    # cache is keyed on the hour too and old entries stop being hit.
+    return _parse_when_cached(text, int(time.time()) // 3600)
+
+
+def _fast_parse_when(text: str):
+    """
+    Handle the common "<day word> at <time>" shape with strptime.
+    Returns None when the message needs the full dateparser treatment.
+    """
+    m = TIME_RE.search(text)
+    if not m:
+        return None
+
+    day = DAY_RE.search(text)
+    # "next friday" and friends are left to dateparser
+    if day is None or day.group(1):
+        return None
+
+    time_part = m.group(0).replace(" ", "").upper()
+    t = None
+    for fmt in TIME_FORMATS:
+        try:
+            t = datetime.strptime(time_part, fmt)
+            break
+        except ValueError:
+            continue
+    if t is None:
+        return None
+
+    day_word = day.group(2).lower()
+    # "tonight at 8" means 8 PM when no am/pm is given
+    has_meridiem = time_part.endswith(("AM", "PM"))
+    if day_word == "tonight" and not has_meridiem and t.hour < 12:
+        t = t.replace(hour=t.hour + 12)
+
+    # Same naive New York time dateparser would give back
+    now = datetime.now(LOCAL_TZ).replace(tzinfo=None)
+    if day_word in ("today", "tonight"):
+        offset = 0
+    elif day_word == "tomorrow":
+        offset = 1
+    else:
+        offset = (WEEKDAYS.index(day_word) - now.weekday()) % 7
+
+    dt = now.replace(hour=t.hour, minute=t.minute, second=0, microsecond=0)
+    dt = dt + timedelta(days=offset)
+    if dt <= now:
+        # A weekday that is today but already passed means next week
+        if day_word in WEEKDAYS:
+            dt = dt + timedelta(days=7)
+        # A passed time "today" is ambiguous, leave it to dateparser
+        elif offset == 0:
+            return None
+
+    return dt
+
+
+@lru_cache(maxsize=2048)
+def _parse_when_cached(text: str, _bucket: int):
+    parsed = _fast_parse_when(text)
+    if parsed is not None:
+        return parsed
+
+    # Otherwise let dateparser try on the full text
+    # English only, and skip the timestamp / no-spaces parsers, which are
+    # slow and never useful for chat messages
+    parsed = _dateparser().parse(
         text,
+        languages=["en"],
         settings={
             "PREFER_DATES_FROM": "future",
             "TIMEZONE": "America/New_York",
             "RETURN_AS_TIMEZONE_AWARE": False,  # keep it simple
+            "PARSERS": ["absolute-time", "relative-time", "custom-formats"],
         },
     )
     if parsed is not None:
         return parsed
 
     # If that failed but there is a time, assume "next occurrence of that time"
-    lowered = text.lower()
-    m = re.search(TIME_PATTERN, lowered)
+    m = TIME_RE.search(text)
     if not m:
         return None
 
     time_part = m.group(0)
-    time_only = dateparser.parse(time_part)
+    time_only = _dateparser().parse(time_part, languages=["en"])
     if time_only is None:
         return None
 
-    now = datetime.now()
+    # Same New York clock as the fast path, not the server's local time
+    now = datetime.now(LOCAL_TZ).replace(tzinfo=None)
     dt = now.replace(
         hour=time_only.hour,
         minute=time_only.minute,
@@ -129,16 +251,42 @@ def looks_like_study_session(text: str) -> bool:
         - a time (4pm, 18:00, 7:30pm, etc) OR
         - a schedule keyword (tomorrow, saturday, after class, etc)
     """
+    # Too short to even hold "study"
+    if len(text) < 5:
+        return False
+
+    # Plain substring checks are much cheaper than INTENT_RE, which has to
+    # try a match at every position, so regular chat bails out here
     lowered = text.lower()
+    if not any(t in lowered for t in INTENT_PREFIX_TRIGGERS):
+        return False
 
-    has_intent = any(kw in lowered for kw in INTENT_KEYWORDS)
-    if not has_intent:
+    if INTENT_RE.search(text) is None:
         return False
 
-    has_time = re.search(TIME_PATTERN, lowered) is not None
-    has_schedule_word = any(kw in lowered for kw in SCHEDULE_KEYWORDS)
+    # No digits means no time. The digit scan is much cheaper than TIME_RE
+    # and most chat has no digits at all
+    if _DIGIT_RE.search(text) is not None and TIME_RE.search(text) is not None:
+        return True
+
+    return SCHEDULE_RE.search(text) is not None
+
+
+# ==============================
+# MESSAGE TEMPLATES
+# ==============================
+
+SESSION_TEMPLATE = (
+    "📚 **Proposed Study Session**\n"
+    "**From:** {author}\n"
+    "**Details (original):** {content}\n"
+    "{when_line}\n"
+    "React below to RSVP:\n"
+    "✅ Going   ❓ Maybe   ❌ Not going"
+)
 
-    return has_time or has_schedule_word
+CONFIRM_REPLY = "Got it. Posting this in #study-group-planning."
+DECLINE_REPLY = "No problem. I will ignore that message."
 
 
 # ==============================
@@ -160,12 +308,9 @@ class ConfirmStudyView(discord.ui.View):
             )
             return
 
-        await interaction.response.send_message(
-            "Got it. Posting this in #study-group-planning.",
-            ephemeral=True
-        )
+        await interaction.response.send_message(CONFIRM_REPLY, ephemeral=True)
 
-        study_channel = interaction.client.get_channel(STUDY_CHANNEL_ID)
+        study_channel = _study_channel
         if study_channel is None:
             await interaction.followup.send(
                 "I could not find the study group channel.",
@@ -184,17 +329,19 @@ class ConfirmStudyView(discord.ui.View):
             when_line = f"**When:** {when_str} (ET)\n"
 
         session_message = await study_channel.send(
-            f"📚 **Proposed Study Session**\n"
-            f"**From:** {author.mention}\n"
-            f"**Details (original):** {content}\n"
-            f"{when_line}\n"
-            f"React below to RSVP:\n"
-            f"✅ Going   ❓ Maybe   ❌ Not going"
+            SESSION_TEMPLATE.format(
+                author=author.mention,
+                content=content,
+                when_line=when_line,
+            )
         )
 
-        await session_message.add_reaction("✅")
-        await session_message.add_reaction("❓")
-        await session_message.add_reaction("❌")
+        # Send all three at once instead of waiting on each request
+        await asyncio.gather(
+            session_message.add_reaction("✅"),
+            session_message.add_reaction("❓"),
+            session_message.add_reaction("❌"),
+        )
 
         # Disable buttons after use
         for child in self.children:
@@ -212,10 +359,7 @@ class ConfirmStudyView(discord.ui.View):
             )
             return
 
-        await interaction.response.send_message(
-            "No problem. I will ignore that message.",
-            ephemeral=True
-        )
+        await interaction.response.send_message(DECLINE_REPLY, ephemeral=True)
 
         for child in self.children:
             if isinstance(child, discord.ui.Button):
@@ -227,21 +371,44 @@ class ConfirmStudyView(discord.ui.View):
 # BOT EVENTS
 # ==============================
 
+@bot.event
+async def setup_hook():
+    # The channel cache is still empty here, so ask the API directly and
+    # complain once at startup instead of on every Yes click
+    global _study_channel
+    try:
+        channel = await bot.fetch_channel(STUDY_CHANNEL_ID)
+    except discord.HTTPException:
+        channel = None
+
+    if isinstance(channel, discord.TextChannel):
+        _study_channel = channel
+    else:
+        print(f"Study channel {STUDY_CHANNEL_ID} is missing or not a text channel.")
+
+
 @bot.event
 async def on_ready():
+    # Prefer the cached channel object now that the cache is filled
+    global _study_channel
+    channel = bot.get_channel(STUDY_CHANNEL_ID)
+    if isinstance(channel, discord.TextChannel):
+        _study_channel = channel
+
     print(f"Logged in as {bot.user} (ID: {bot.user.id})")
     print("Bot is ready.")
 
 
 @bot.event
 async def on_message(message: discord.Message):
-    # Keep commands working
-    await bot.process_commands(message)
-
     # Ignore other bots
     if message.author.bot:
         return
 
+    # Keep commands working, but only pay for dispatch on prefixed messages
+    if message.content.startswith(bot.command_prefix):
+        await bot.process_commands(message)
+
     # Only watch the general discussion channel
     if message.channel.id != GENERAL_CHANNEL_ID:
         return
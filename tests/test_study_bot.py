@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("discord")
+
+import study_bot
+
+
+class FrozenDatetime(datetime):
+    # Thursday, 3 PM Eastern. Without a tz it answers in UTC, like the
+    # Heroku host does.
+    FROZEN = datetime(2026, 10, 15, 15, 0, tzinfo=study_bot.LOCAL_TZ)
+
+    @classmethod
+    def now(cls, tz=None):
+        if tz is None:
+            return cls.FROZEN.astimezone(timezone.utc).replace(tzinfo=None)
+        return cls.FROZEN.astimezone(tz)
+
+
+@pytest.fixture(autouse=True)
+def frozen_clock(monkeypatch):
+    monkeypatch.setattr(study_bot, "datetime", FrozenDatetime)
+    study_bot._parse_when_cached.cache_clear()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("let's study today at 5pm", datetime(2026, 10, 15, 17, 0)),
+    ("study tomorrow at 4pm", datetime(2026, 10, 16, 16, 0)),
+    ("review saturday 7:30 PM", datetime(2026, 10, 17, 19, 30)),
+    ("meet thursday at 9am", datetime(2026, 10, 22, 9, 0)),
+    ("study tonight at 8:00", datetime(2026, 10, 15, 20, 0)),
+    ("study tonight at 9pm", datetime(2026, 10, 15, 21, 0)),
+])
+def test_fast_parse_when(text, expected):
+    assert study_bot._fast_parse_when(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "let's study today at 9am",
+    "study tonight at 2pm",
+    "study next friday at 4pm",
+    "study at 4pm",
+])
+def test_fast_parse_when_defers_to_dateparser(text):
+    assert study_bot._fast_parse_when(text) is None
+
+
+@pytest.mark.parametrize("text, expected", [
+    # No day word, so these go through the "next occurrence" fallback
+    ("let's study at 4pm", datetime(2026, 10, 15, 16, 0)),
+    ("let's study at 9am", datetime(2026, 10, 16, 9, 0)),
+    # Passed "today" times are handed to the fallback too
+    ("let's study today at 9am", datetime(2026, 10, 16, 9, 0)),
+])
+def test_parse_when_fallback_uses_eastern_time(text, expected):
+    assert study_bot.parse_when(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("lol", False),
+    ("Studying tomorrow?", True),
+    ("meet at 7:30", True),
+    ("let's study at midnight", True),
+    ("group up some weeknight", True),
+    ("obsession at 4pm", False),
+    ("we should review", False),
+])
+def test_looks_like_study_session(text, expected):
+    assert study_bot.looks_like_study_session(text) is expected